@@ -24,9 +24,11 @@ class NamespacedAccessPolicyMixin:
             namespace = obj.namespace
             return request.user.has_perm(permission, namespace)
         elif type(obj) == models.ContainerPushRepository:
-            dists_qs = models.ContainerDistribution.objects.filter(repository=obj)
-            for dist in dists_qs:
-                if request.user.has_perm(permission, dist.namespace):
+            namespaces_qs = models.ContainerNamespace.objects.filter(
+                container_distributions__repository=obj
+            )
+            for namespace in namespaces_qs:
+                if request.user.has_perm(permission, namespace):
                     return True
         return False
 
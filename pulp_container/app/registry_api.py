@@ -293,9 +293,12 @@ class ContainerRegistryApiMixin:
         """
         Get distribution, repository and repository_version for pull access.
         """
-        try:
-            distribution = models.ContainerDistribution.objects.get(base_path=path)
-        except models.ContainerDistribution.DoesNotExist:
+        distribution = (
+            models.ContainerDistribution.objects.select_related("repository", "repository_version")
+            .filter(base_path=path)
+            .first()
+        )
+        if distribution is None:
             raise RepositoryNotFound(name=path)
         if distribution.repository:
             repository_version = distribution.repository.latest_version()
@@ -311,9 +314,12 @@ class ContainerRegistryApiMixin:
 
         Optionally create them if not found.
         """
-        try:
-            distribution = models.ContainerDistribution.objects.get(base_path=path)
-        except models.ContainerDistribution.DoesNotExist:
+        distribution = (
+            models.ContainerDistribution.objects.select_related("repository")
+            .filter(base_path=path)
+            .first()
+        )
+        if distribution is None:
             if create:
                 try:
                     with transaction.atomic():
@@ -1,3 +1,6 @@
+from functools import lru_cache
+
+
 def get_accepted_media_types(headers):
     """
     Returns a list of media types from the Accept headers.
@@ -10,9 +13,24 @@ def get_accepted_media_types(headers):
         List of media types supported by the client.
 
     """
+    getall = getattr(headers, "getall", None)
+    if getall is not None:
+        values = getall("Accept", [])
+    else:
+        value = headers.get("Accept")
+        values = [value] if value is not None else []
+
     accepted_media_types = []
-    for header, values in headers.items():
-        if header == "Accept":
-            values = [v.strip() for v in values.split(",")]
-            accepted_media_types.extend(values)
+    for value in values:
+        accepted_media_types.extend(_parse_accept_header(value))
     return accepted_media_types
+
+
+@lru_cache(maxsize=256)
+def _parse_accept_header(value):
+    """
+    Split a raw Accept header value into a tuple of media types.
+
+    Clients send only a handful of distinct Accept values, so the parsed result is cached.
+    """
+    return tuple(v.strip() for v in value.split(","))